@@ -10,8 +10,10 @@ from __future__ import annotations
 
 import argparse
 import json
+import logging
 import math
 import random
+import socket
 import sys
 import time
 import tomllib
@@ -19,6 +21,14 @@ from pathlib import Path
 
 import paho.mqtt.client as mqtt
 
+# orjson is optional. If it is available, use it to encode payloads: it emits
+# bytes directly (which paho accepts) and is several times faster than the
+# standard library encoder.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add the src directory to sys.path so we can import parse_nmea
 src_dir = str(Path(__file__).resolve().parent.parent / "src")
 sys.path.insert(0, src_dir)
@@ -28,6 +38,20 @@ import parse_nmea
 # Global configuration dictionary
 config = {}
 
+log = logging.getLogger("nmea-simulator")
+
+# When True, publish by generating each NMEA sentence string and running it
+# back through parse_nmea.parse(), verifying that the generators and the
+# parser agree. Slower; the default path builds the parsed dicts directly.
+VERIFY_ROUNDTRIP = False
+
+# Sine and cosine of the math-convention angle (90 - cog) for each whole
+# degree of course. Two tuple indexes replace three libm calls per tick;
+# quantizing the course to a degree is well inside the simulator's random
+# jitter.
+_SIN = tuple(math.sin(math.radians(90.0 - d)) for d in range(360))
+_COS = tuple(math.cos(math.radians(90.0 - d)) for d in range(360))
+
 # Simulator state
 class SimulatorState:
     def __init__(self):
@@ -43,51 +67,101 @@ class SimulatorState:
         self.heading = 45.0
 
         self.depth = 15.0
-        
+
         # Last update time
         self.last_update = time.time()
+
+        # Cache of cos(lat) for the longitude step, and the latitude it was
+        # computed at. At boat speeds it is nearly constant.
+        self._coslat = math.cos(math.radians(self.lat))
+        self._coslat_lat = self.lat
+
+        # Per-tick cache of the NMEA-formatted position; see _position_strings.
+        self._position_strings = None
         
     def update(self):
         now = time.time()
         dt = now - self.last_update
         self.last_update = now
-        
-        # Add some random fluctuations to SOG and COG
-        self.sog += random.uniform(-0.1, 0.1)
-        self.sog = max(0.0, min(self.sog, 20)) # Keep speed within 0-20 knots
-        
-        self.cog += random.uniform(-1.0, 1.0)
-        self.cog %= 360
-        
-        # Heading follows COG with some deviation
-        self.heading = (self.cog + random.uniform(-2.0, 2.0)) % 360
-        
-        # Update position based on SOG and COG
-        # 1 knot = 1 nautical mile per hour
-        # 1 nautical mile = 1 minute of latitude
-        # 1 minute of latitude = 1/60 degree
-        
-        # Distance traveled in nautical miles
-        distance_nm = (self.sog * dt) / 3600.0
-        
-        # Heading and course are in degrees true.
-        # NMEA 0183 convention: 0 is North, 90 is East, 180 is South, 270 is West.
-        # Math convention: 0 is East, 90 is North.
-        # Angle in math convention: angle_math = (90 - cog) % 360
-        angle_math = math.radians(90.0 - self.cog)
-
-        # Change in latitude (nm * sin(angle_math))
-        d_lat_deg = (distance_nm * math.sin(angle_math)) / 60.0
-        
-        # Change in longitude (nm * cos(angle_math) / cos(lat))
-        d_lon_deg = (distance_nm * math.cos(angle_math)) / (60.0 * math.cos(math.radians(self.lat)))
-        
-        self.lat += d_lat_deg
-        self.lon += d_lon_deg
 
-        self.depth += random.uniform(-1.0, 1.0)
-        if self.depth < 0:
-            self.depth = 15.0
+        # Only refresh the cos(lat) cache once the boat has moved ~0.01
+        # degree of latitude.
+        if abs(self.lat - self._coslat_lat) > 0.01:
+            self._coslat = math.cos(math.radians(self.lat))
+            self._coslat_lat = self.lat
+
+        # The position is about to move; drop the formatted-position cache.
+        self._position_strings = None
+
+        # Draw the random deltas here; _step itself is deterministic. Bind
+        # uniform to a local once rather than four module-attribute lookups.
+        uniform = random.uniform
+        (self.lat, self.lon, self.sog, self.cog,
+         self.heading, self.depth) = _step(
+            self.lat, self.lon, self.sog, self.cog, self.depth,
+            dt, self._coslat,
+            uniform(-0.1, 0.1),
+            uniform(-1.0, 1.0),
+            uniform(-2.0, 2.0),
+            uniform(-1.0, 1.0))
+
+
+def _step(lat: float, lon: float, sog: float, cog: float, depth: float,
+          dt: float, coslat: float,
+          r_sog: float, r_cog: float, r_hdg: float, r_depth: float,
+          ) -> tuple[float, float, float, float, float, float]:
+    """Advance the dead-reckoning state by dt seconds.
+
+    Pure scalar math over the previous state, the caller's cached cos(lat),
+    and pre-drawn random deltas; returns the new
+    (lat, lon, sog, cog, heading, depth). Keeping it free of object, random,
+    and clock state means it can be compiled wholesale (e.g. numba.njit)
+    should the simulator ever be scaled up, without touching the class."""
+
+    # Apply the random fluctuations to SOG and COG
+    sog = max(0.0, min(sog + r_sog, 20))  # Keep speed within 0-20 knots
+
+    # The deltas are at most a couple of degrees and cog is already in
+    # [0, 360), so a conditional add/subtract wraps correctly and is cheaper
+    # than float modulo.
+    cog += r_cog
+    if cog >= 360.0:
+        cog -= 360.0
+    elif cog < 0.0:
+        cog += 360.0
+
+    # Heading follows COG with some deviation
+    heading = cog + r_hdg
+    if heading >= 360.0:
+        heading -= 360.0
+    elif heading < 0.0:
+        heading += 360.0
+
+    # Update position based on SOG and COG
+    # 1 knot = 1 nautical mile per hour
+    # 1 nautical mile = 1 minute of latitude
+    # 1 minute of latitude = 1/60 degree
+
+    # Distance traveled in nautical miles
+    distance_nm = (sog * dt) / 3600.0
+
+    # Heading and course are in degrees true.
+    # NMEA 0183 convention: 0 is North, 90 is East, 180 is South, 270 is West.
+    # Math convention: 0 is East, 90 is North.
+    # _SIN/_COS hold sin/cos of the math-convention angle (90 - cog) per
+    # whole degree of course.
+    i = int(cog) % 360
+
+    # Change in latitude (nm * sin(angle_math))
+    lat += (distance_nm * _SIN[i]) / 60.0
+    # Change in longitude (nm * cos(angle_math) / cos(lat))
+    lon += (distance_nm * _COS[i]) / (60.0 * coslat)
+
+    depth += r_depth
+    if depth < 0:
+        depth = 15.0
+
+    return lat, lon, sog, cog, heading, depth
 
 state = SimulatorState()
 
@@ -107,6 +181,11 @@ def main():
         print(f"Error loading configuration file {args.config}: {e}", file=sys.stderr)
         sys.exit(1)
 
+    # One-time startup messages stay on stdout; per-publish chatter goes
+    # through logging, so no message string is built unless DEBUG is enabled.
+    logging.basicConfig(level=logging.DEBUG if config.get("DEBUG") else logging.INFO,
+                        format="%(name)s: %(levelname)s %(message)s")
+
     print("Starting NMEA simulator...")
     mqtt_broker = config.get("MQTT_BROKER", "localhost")
     mqtt_port = config.get("MQTT_PORT", 1883)
@@ -124,28 +203,62 @@ def main():
         f"Connected to MQTT broker with result code: {r}")
 
     client.connect(mqtt_broker, mqtt_port, 60)
+    # Disable Nagle so each tick's burst of small publishes goes out right
+    # away instead of waiting on the coalescing timer, and give the socket a
+    # large enough send buffer that a whole burst never blocks the writer.
+    try:
+        sock = client.socket()
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 262144)
+    except (AttributeError, OSError) as e:
+        print(f"Could not set socket options: {e}", file=sys.stderr)
     client.loop_start()
 
     try:
         publish_intervals = config.get("PUBLISH_INTERVALS", {})
+        next_tick = time.monotonic()
         while True:
             # Update the simulator state
             state.update()
-            
-            # Generate and publish data for each sentence type in PUBLISH_INTERVALS
+
+            # Format the time strings once per tick: the clock does not move
+            # between sentences. f-strings over the struct_time fields skip
+            # libc's format-string parsing in strftime.
+            now = time.gmtime()
+            hhmmss = f"{now.tm_hour:02d}{now.tm_min:02d}{now.tm_sec:02d}"
+            ddmmyy = f"{now.tm_mday:02d}{now.tm_mon:02d}{now.tm_year % 100:02d}"
+
+            # Generate and parse everything for this tick first, then publish
+            # the batch back-to-back, so paho's network thread can send the
+            # whole tick in coalesced TCP segments instead of one write per
+            # sentence.
+            batch = []
             for sentence_type in publish_intervals:
-                sentence = generate_sentence(sentence_type[2:])
-                if sentence:
-                    try:
-                        parsed_nmea = parse_nmea.parse(sentence)
-                        publish_nmea(client, parsed_nmea)
-                    except Exception as e:
-                        print(f"Error parsing/publishing {sentence_type}: {e}")
-
-            # Wait for a bit before the next round. 
-            # In a real simulator we might want different frequencies, 
-            # but for now, let's just loop every 10 seconds (default interval in config)
-            time.sleep(10)
+                if VERIFY_ROUNDTRIP:
+                    # Exercise the full sentence-string path through the parser.
+                    sentence = generate_sentence(sentence_type[2:], hhmmss, ddmmyy)
+                    if sentence:
+                        try:
+                            _, parsed_nmea = parse_nmea.parse(sentence)
+                            batch.append(parsed_nmea)
+                        except Exception as e:
+                            log.error("Error parsing %s: %s", sentence_type, e)
+                else:
+                    parsed_nmea = generate_parsed(sentence_type[2:], hhmmss, ddmmyy)
+                    if parsed_nmea:
+                        batch.append(parsed_nmea)
+
+            for parsed_nmea in batch:
+                try:
+                    publish_nmea(client, parsed_nmea)
+                except Exception as e:
+                    log.error("Error publishing %s: %s", parsed_nmea.get('sentence_type'), e)
+
+            # Wait for the next 10-second deadline rather than sleeping a flat
+            # 10 s after the work: the cadence then stays constant no matter
+            # how long generating and publishing took.
+            next_tick += 10.0
+            time.sleep(max(0.0, next_tick - time.monotonic()))
     except KeyboardInterrupt:
         print("\nStopping simulator...")
     finally:
@@ -153,83 +266,341 @@ def main():
         client.disconnect()
 
 
-def generate_sentence(sentence_type: str) -> str | None:
-    """Generate a synthetic NMEA 0183 sentence."""
-    now = time.gmtime()
-    hhmmss = time.strftime("%H%M%S", now)
-    ddmmyy = time.strftime("%d%m%y", now)
+def _position_strings(state: SimulatorState) -> tuple[str, str, str, str]:
+    """Convert the state's decimal-degree position to NMEA DDMM.MMM format.
+
+    Returns (lat_str, lat_dir, lon_str, lon_dir). Every position sentence in a
+    tick sees the same fix, so the result is cached on the state and
+    invalidated when update() moves the boat."""
+    cached = state._position_strings
+    if cached is not None:
+        return cached
 
-    # Convert decimal degrees to NMEA format (DDMM.MMM)
     lat_abs = abs(state.lat)
     lat_deg = int(lat_abs)
     lat_min = (lat_abs - lat_deg) * 60
     lat_dir = 'N' if state.lat >= 0 else 'S'
-    
+
     lon_abs = abs(state.lon)
     lon_deg = int(lon_abs)
     lon_min = (lon_abs - lon_deg) * 60
     lon_dir = 'E' if state.lon >= 0 else 'W'
 
-    if sentence_type == "GGA":
-        # $GPGGA,hhmmss.ss,llll.ll,a,yyyyy.yy,a,x,xx,x.x,x.x,M,x.x,M,x.x,xxxx*hh
-        payload = f"GPGGA,{hhmmss}.00,{lat_deg:02d}{lat_min:06.3f},{lat_dir},{lon_deg:03d}{lon_min:06.3f},{lon_dir},1,08,0.9,10.0,M,-30.0,M,,"
-    elif sentence_type == "RMC":
-        # $GPRMC,hhmmss.ss,A,llll.ll,a,yyyyy.yy,a,x.x,x.x,ddmmyy,x.x,a*hh
-        payload = f"GPRMC,{hhmmss}.00,A,{lat_deg:02d}{lat_min:06.3f},{lat_dir},{lon_deg:03d}{lon_min:06.3f},{lon_dir},{state.sog:.1f},{state.cog:.1f},{ddmmyy},15.0,E"
-    elif sentence_type == "DPT":
-        # $IIDPT,x.x,x.x,x.x*hh
-        depth = state.depth
-        offset = 1.5
-        payload = f"IIDPT,{depth:.1f},{offset:.1f},100.0"
-    elif sentence_type == "MWV":
-        # $IIMWV,x.x,a,x.x,a,A*hh
-        # Relative wind angle and speed
-        angle = random.uniform(0, 360)
-        speed = random.uniform(0, 30)
-        payload = f"IIMWV,{angle:.1f},R,{speed:.1f},N,A"
-    elif sentence_type == "HDT":
-        # $IIHDT,x.x,T*hh
-        payload = f"IIHDT,{state.heading:.1f},T"
-    elif sentence_type == "GLL":
-        # $GPGLL,llll.ll,a,yyyyy.yy,a,hhmmss.ss,A,a*hh
-        payload = f"GPGLL,{lat_deg:02d}{lat_min:06.3f},{lat_dir},{lon_deg:03d}{lon_min:06.3f},{lon_dir},{hhmmss}.00,A,A"
-    elif sentence_type == "VTG":
-        # $GPVTG,x.x,T,x.x,M,x.x,N,x.x,K,a*hh
-        payload = f"GPVTG,{state.cog:.1f},T,{state.cog - 15.0:.1f},M,{state.sog:.1f},N,{state.sog * 1.852:.1f},K,A"
-    elif sentence_type == "ROT":
-        # $IIROT,x.x,A*hh
-        rot = random.uniform(-5, 5)
-        payload = f"IIROT,{rot:.1f},A"
-    elif sentence_type == "RSA":
-        # $IIRSA,x.x,A,x.x,A*hh
-        rudder = random.uniform(-30, 30)
-        payload = f"IIRSA,{rudder:.1f},A,{rudder:.1f},A"
-    elif sentence_type == "MDA":
-        # $IIMDA,x.x,I,x.x,B,x.x,C,x.x,C,x.x,x.x,x.x,C,x.x,T,x.x,M,x.x,N,x.x,M*hh
-        temp = 20.0 + random.uniform(-5, 5)
-        press = 1013.0 + random.uniform(-10, 10)
-        payload = f"IIMDA,30.0,I,{press / 1000:.3f},B,{temp:.1f},C,,,,,15.0,C,,,,,,"
-    elif sentence_type == "VWR":
-        # $IIVWR,x.x,a,x.x,N,x.x,M,x.x,K*hh
-        angle = random.uniform(0, 180)
-        speed = random.uniform(0, 30)
-        payload = f"IIVWR,{angle:.1f},L,{speed:.1f},N,{speed * 0.514:.1f},M,{speed * 1.852:.1f},K"
-    elif sentence_type == "VLW":
-        # $IIVLW,x.x,N,x.x,N,x.x,N,x.x,N*hh
-        payload = f"IIVLW,123.4,N,12.3,N,110.0,N,11.0,N"
-    else:
-        return None
+    result = (f"{lat_deg:02d}{lat_min:06.3f}", lat_dir,
+              f"{lon_deg:03d}{lon_min:06.3f}", lon_dir)
+    state._position_strings = result
+    return result
+
+
+# One small generator function per sentence type. Each returns the payload
+# (everything between the '$' and the '*'), leaving the checksum to the caller.
+
+def _gen_gga(hhmmss, ddmmyy, state):
+    # $GPGGA,hhmmss.ss,llll.ll,a,yyyyy.yy,a,x,xx,x.x,x.x,M,x.x,M,x.x,xxxx*hh
+    lat_str, lat_dir, lon_str, lon_dir = _position_strings(state)
+    return f"GPGGA,{hhmmss}.00,{lat_str},{lat_dir},{lon_str},{lon_dir},1,08,0.9,10.0,M,-30.0,M,,"
+
+def _gen_rmc(hhmmss, ddmmyy, state):
+    # $GPRMC,hhmmss.ss,A,llll.ll,a,yyyyy.yy,a,x.x,x.x,ddmmyy,x.x,a*hh
+    lat_str, lat_dir, lon_str, lon_dir = _position_strings(state)
+    return (f"GPRMC,{hhmmss}.00,A,{lat_str},{lat_dir},{lon_str},{lon_dir},"
+            f"{state.sog:.1f},{state.cog:.1f},{ddmmyy},15.0,E")
+
+def _gen_dpt(hhmmss, ddmmyy, state):
+    # $IIDPT,x.x,x.x,x.x*hh
+    offset = 1.5
+    return f"IIDPT,{state.depth:.1f},{offset:.1f},100.0"
+
+def _gen_mwv(hhmmss, ddmmyy, state):
+    # $IIMWV,x.x,a,x.x,a,A*hh
+    # Relative wind angle and speed
+    angle = random.uniform(0, 360)
+    speed = random.uniform(0, 30)
+    return f"IIMWV,{angle:.1f},R,{speed:.1f},N,A"
+
+def _gen_hdt(hhmmss, ddmmyy, state):
+    # $IIHDT,x.x,T*hh
+    return f"IIHDT,{state.heading:.1f},T"
 
+def _gen_gll(hhmmss, ddmmyy, state):
+    # $GPGLL,llll.ll,a,yyyyy.yy,a,hhmmss.ss,A,a*hh
+    lat_str, lat_dir, lon_str, lon_dir = _position_strings(state)
+    return f"GPGLL,{lat_str},{lat_dir},{lon_str},{lon_dir},{hhmmss}.00,A,A"
+
+def _gen_vtg(hhmmss, ddmmyy, state):
+    # $GPVTG,x.x,T,x.x,M,x.x,N,x.x,K,a*hh
+    return (f"GPVTG,{state.cog:.1f},T,{state.cog - 15.0:.1f},M,"
+            f"{state.sog:.1f},N,{state.sog * 1.852:.1f},K,A")
+
+def _gen_rot(hhmmss, ddmmyy, state):
+    # $IIROT,x.x,A*hh
+    rot = random.uniform(-5, 5)
+    return f"IIROT,{rot:.1f},A"
+
+def _gen_rsa(hhmmss, ddmmyy, state):
+    # $IIRSA,x.x,A,x.x,A*hh
+    rudder = random.uniform(-30, 30)
+    return f"IIRSA,{rudder:.1f},A,{rudder:.1f},A"
+
+def _gen_mda(hhmmss, ddmmyy, state):
+    # $IIMDA,x.x,I,x.x,B,x.x,C,x.x,C,x.x,x.x,x.x,C,x.x,T,x.x,M,x.x,N,x.x,M*hh
+    temp = 20.0 + random.uniform(-5, 5)
+    press = 1013.0 + random.uniform(-10, 10)
+    return f"IIMDA,30.0,I,{press / 1000:.3f},B,{temp:.1f},C,15.0,C,,,,C,,T,,M,,N,,M"
+
+def _gen_vwr(hhmmss, ddmmyy, state):
+    # $IIVWR,x.x,a,x.x,N,x.x,M,x.x,K*hh
+    angle = random.uniform(0, 180)
+    speed = random.uniform(0, 30)
+    return f"IIVWR,{angle:.1f},L,{speed:.1f},N,{speed * 0.514:.1f},M,{speed * 1.852:.1f},K"
+
+def _gen_vlw(hhmmss, ddmmyy, state):
+    # $IIVLW,x.x,N,x.x,N,x.x,N,x.x,N*hh
+    return f"IIVLW,123.4,N,12.3,N,110.0,N,11.0,N"
+
+
+# Dispatch table, keyed by sentence type. One dictionary lookup replaces the
+# old chain of up to twelve string comparisons per sentence.
+_GENERATORS = {
+    "GGA": _gen_gga,
+    "RMC": _gen_rmc,
+    "DPT": _gen_dpt,
+    "MWV": _gen_mwv,
+    "HDT": _gen_hdt,
+    "GLL": _gen_gll,
+    "VTG": _gen_vtg,
+    "ROT": _gen_rot,
+    "RSA": _gen_rsa,
+    "MDA": _gen_mda,
+    "VWR": _gen_vwr,
+    "VLW": _gen_vlw,
+}
+
+
+def generate_sentence(sentence_type: str, hhmmss: str, ddmmyy: str) -> str | None:
+    """Generate a synthetic NMEA 0183 sentence.
+
+    The time strings are passed in by the caller, which formats them once per
+    tick rather than once per sentence."""
+    fn = _GENERATORS.get(sentence_type)
+    if fn is None:
+        return None
+    payload = fn(hhmmss, ddmmyy, state)
     cs = parse_nmea.checksum(payload)
     return f"${payload}*{cs:02X}"
 
 
+# One builder per sentence type, producing the same dict parse_nmea.parse()
+# returns for the matching generated sentence (fields rounded to the precision
+# the sentence strings carry). Building the dict directly skips the whole
+# format/checksum/parse round-trip on the publish path.
+#
+# Each builder reuses a per-type template dict, rewriting only the fields that
+# actually change between ticks. This is safe because publish_nmea serializes
+# the dict before returning; nothing holds a reference across ticks.
+
+_TMPL_GGA = {
+    "timeUTC": None,
+    "latitude": None,
+    "longitude": None,
+    "fix_quality": "1",
+    "num_satellites": 8,
+    "hdop": 0.9,
+    "altitude_meter": 10.0,
+}
+
+def _dict_gga(hhmmss, ddmmyy, state):
+    d = _TMPL_GGA
+    d["timeUTC"] = f"{hhmmss[:2]}:{hhmmss[2:4]}:{hhmmss[4:6]}"
+    d["latitude"] = round(state.lat, 6)
+    d["longitude"] = round(state.lon, 6)
+    return d
+
+_TMPL_RMC = {
+    "datetimeUTC": None,
+    "status": "A",
+    "latitude": None,
+    "longitude": None,
+    "sog_knots": None,
+    "cog_true": None,
+    "magnetic_variation": "15.0",
+}
+
+def _dict_rmc(hhmmss, ddmmyy, state):
+    d = _TMPL_RMC
+    d["datetimeUTC"] = (f"20{ddmmyy[4:6]}-{ddmmyy[2:4]}-{ddmmyy[:2]}"
+                        f"T{hhmmss[:2]}:{hhmmss[2:4]}:{hhmmss[4:6]}")
+    d["latitude"] = round(state.lat, 6)
+    d["longitude"] = round(state.lon, 6)
+    d["sog_knots"] = round(state.sog, 1)
+    d["cog_true"] = round(state.cog, 1)
+    return d
+
+_TMPL_DPT = {
+    "depth_below_transducer_meters": None,
+    "transducer_depth_meters": 1.5,
+    "water_depth_meters": None,
+}
+
+def _dict_dpt(hhmmss, ddmmyy, state):
+    d = _TMPL_DPT
+    depth = round(state.depth, 1)
+    d["depth_below_transducer_meters"] = depth
+    d["water_depth_meters"] = depth + 1.5
+    return d
+
+_TMPL_MWV = {"awa": None, "aws_knots": None}
+
+def _dict_mwv(hhmmss, ddmmyy, state):
+    d = _TMPL_MWV
+    d["awa"] = round(random.uniform(0, 360), 1)
+    d["aws_knots"] = round(random.uniform(0, 30), 1)
+    return d
+
+_TMPL_HDT = {"hdg_true": None}
+
+def _dict_hdt(hhmmss, ddmmyy, state):
+    d = _TMPL_HDT
+    d["hdg_true"] = round(state.heading, 1)
+    return d
+
+_TMPL_GLL = {
+    "latitude": None,
+    "longitude": None,
+    "timeUTC": None,
+    "gll_mode": "A",
+}
+
+def _dict_gll(hhmmss, ddmmyy, state):
+    d = _TMPL_GLL
+    d["latitude"] = round(state.lat, 6)
+    d["longitude"] = round(state.lon, 6)
+    d["timeUTC"] = f"{hhmmss[:2]}:{hhmmss[2:4]}:{hhmmss[4:6]}"
+    return d
+
+_TMPL_VTG = {
+    "cog_true": None,
+    "cog_magnetic": None,
+    "sog_knots": None,
+    "sog_kph": None,
+}
+
+def _dict_vtg(hhmmss, ddmmyy, state):
+    d = _TMPL_VTG
+    d["cog_true"] = round(state.cog, 1)
+    d["cog_magnetic"] = round(state.cog - 15.0, 1)
+    d["sog_knots"] = round(state.sog, 1)
+    d["sog_kph"] = round(state.sog * 1.852, 1)
+    return d
+
+_TMPL_ROT = {"rate_of_turn": None}
+
+def _dict_rot(hhmmss, ddmmyy, state):
+    d = _TMPL_ROT
+    d["rate_of_turn"] = round(random.uniform(-5, 5), 1)
+    return d
+
+_TMPL_RSA = {"rudder_angle": None}
+
+def _dict_rsa(hhmmss, ddmmyy, state):
+    d = _TMPL_RSA
+    d["rudder_angle"] = round(random.uniform(-30, 30), 1)
+    return d
+
+_TMPL_MDA = {
+    "pressure_inches": 30.0,
+    "pressure_bars": None,
+    "temperature_air_celsius": None,
+    "temperature_water_celsius": 15.0,
+    "humidity_relative": None,
+    "dew_point_celsius": None,
+    "twd_true": None,
+    "twd_magnetic": None,
+    "tws_knots": None,
+    "tws_mps": None,
+    "pressure_millibars": None,
+}
+
+def _dict_mda(hhmmss, ddmmyy, state):
+    d = _TMPL_MDA
+    press = round((1013.0 + random.uniform(-10, 10)) / 1000, 3)
+    d["pressure_bars"] = press
+    d["pressure_millibars"] = press * 1000
+    d["temperature_air_celsius"] = round(20.0 + random.uniform(-5, 5), 1)
+    return d
+
+_TMPL_VWR = {"awa": None, "aws_knots": None, "aws_mps": None, "aws_kph": None}
+
+def _dict_vwr(hhmmss, ddmmyy, state):
+    d = _TMPL_VWR
+    # Wind from port, hence the negative angle.
+    d["awa"] = -round(random.uniform(0, 180), 1)
+    speed = round(random.uniform(0, 30), 1)
+    d["aws_knots"] = speed
+    d["aws_mps"] = round(speed * 0.514, 1)
+    d["aws_kph"] = round(speed * 1.852, 1)
+    return d
+
+_TMPL_VLW = {
+    "water_total_nm": 123.4,
+    "water_since_reset_nm": 12.3,
+    "ground_total_nm": 110.0,
+    "ground_since_reset_nm": 11.0,
+}
+
+def _dict_vlw(hhmmss, ddmmyy, state):
+    return _TMPL_VLW
+
+
+_BUILDERS = {
+    "GGA": _dict_gga,
+    "RMC": _dict_rmc,
+    "DPT": _dict_dpt,
+    "MWV": _dict_mwv,
+    "HDT": _dict_hdt,
+    "GLL": _dict_gll,
+    "VTG": _dict_vtg,
+    "ROT": _dict_rot,
+    "RSA": _dict_rsa,
+    "MDA": _dict_mda,
+    "VWR": _dict_vwr,
+    "VLW": _dict_vlw,
+}
+
+
+def generate_parsed(sentence_type: str, hhmmss: str, ddmmyy: str) -> parse_nmea.NmeaDict | None:
+    """Build the parsed form of a synthetic sentence directly, without a
+    format/parse round-trip. Returns what parse_nmea.parse() would."""
+    fn = _BUILDERS.get(sentence_type)
+    if fn is None:
+        return None
+    data = fn(hhmmss, ddmmyy, state)
+    data["sentence_type"] = sentence_type
+    data["timestamp"] = time.time_ns() // 1_000_000
+    return data
+
+
+# Fully-qualified topic per sentence type. The prefix and MMSI never change
+# after startup, so each topic is formatted once and reused.
+_topics: dict[str, str] = {}
+
+
 def publish_nmea(client: mqtt.Client, parsed_nmea: parse_nmea.NmeaDict):
     """Publish parsed NMEA data to MQTT."""
-    mmsi = config.get("MMSI", "unknown")
-    topic = f"{config.get('MQTT_TOPIC_PREFIX', 'nmea')}/{mmsi}/{parsed_nmea['sentence_type']}"
-    client.publish(topic, json.dumps(parsed_nmea), qos=0)
-    print(f"Published {parsed_nmea['sentence_type']} to {topic}")
+    sentence_type = parsed_nmea['sentence_type']
+    topic = _topics.get(sentence_type)
+    if topic is None:
+        mmsi = config.get("MMSI", "unknown")
+        topic = f"{config.get('MQTT_TOPIC_PREFIX', 'nmea')}/{mmsi}/{sentence_type}"
+        _topics[sentence_type] = topic
+    # Hand paho bytes either way, so it does not re-encode the payload
+    # internally. orjson emits bytes already; stdlib json emits pure-ASCII str.
+    if orjson is not None:
+        payload = orjson.dumps(parsed_nmea)
+    else:
+        payload = json.dumps(parsed_nmea).encode('ascii')
+    client.publish(topic, payload, qos=0)
+    log.debug("Published %s to %s", sentence_type, topic)
 
 
 if __name__ == "__main__":
@@ -157,35 +157,49 @@ async def nmea_reader_task(host, port, subscribers):
         port (int): The port number of the NMEA socket.
         subscribers (list[asyncio.Queue]): List of queues to put parsed NMEA data into.
     """
-    global publish_intervals
     log.info(f"Starting NMEA reader for {host}:{port}")
+    # Bind the names used on every line to locals once: LOAD_FAST instead of a
+    # global or attribute lookup per line.
+    parse = parse_nmea.parse
+    intervals = publish_intervals
+    nmea_errors = 0
     while True:
         try:
             async for line in gen_nmea(host, port):
+                # Check the whitelist first, parse second: the address field can be
+                # read straight off the raw line, so sentence types nobody asked for
+                # are dropped without paying for checksum and decode work.
+                if line.startswith("$"):
+                    comma = line.find(',')
+                    address_field = line[1:comma] if comma != -1 else line[1:]
+                    # Hack for dealing with the FT602. Give it a different talker ID,
+                    # so it doesn't collide with the Airmar 200WX.
+                    if port == 60002 and address_field == "WIMWV":
+                        address_field = "FTMWV"
+                    if address_field not in intervals:
+                        continue
                 try:
                     # Parse the line. Be prepared to catch any exceptions.
-                    address_field, parsed_nmea = parse_nmea.parse(line)
+                    _, parsed_nmea = parse(line)
                 except parse_nmea.UnknownNMEASentence as e:
-                    if e.address_field in publish_intervals:
-                        # The user asked for an address field type,
-                        # yet we don't know anything about it. File a warning.
-                        log.warning(f"No decoder for sentence type: {e.sentence_type}")
-                        print(f"No decoder for NMEA sentence type: {e.sentence_type}",
-                              file=sys.stderr)
-                        continue
+                    # The user asked for this address field type,
+                    # yet we don't know anything about it. File a warning.
+                    log.warning(f"No decoder for sentence type: {e.sentence_type}")
+                    print(f"No decoder for NMEA sentence type: {e.sentence_type}",
+                          file=sys.stderr)
+                    continue
                 except (parse_nmea.NMEAParsingError, parse_nmea.NMEAStatusError) as e:
-                    log.warning("NMEA error: %s", e)
-                    print(f"NMEA error: {e}", file=sys.stderr)
+                    # Corrupt frames come in bursts on noisy links. Log the first
+                    # error and every 100th thereafter, not each one.
+                    nmea_errors += 1
+                    if nmea_errors % 100 == 1:
+                        log.warning("NMEA error (%d so far): %s", nmea_errors, e)
+                        print(f"NMEA error ({nmea_errors} so far): {e}", file=sys.stderr)
                     continue
                 else:
-                    # Hack for dealing with the FT602. Give it a different talker ID, so it doesn't
-                    # collide with the Airmar 200WX.
-                    if port == 60002 and address_field == "WIMWV":
-                        address_field = "FTMWV"
                     # Put the parsed nmea data in the subscriber queues
-                    if address_field in publish_intervals:
-                        for queue in subscribers:
-                            await queue.put((address_field, parsed_nmea))
+                    for queue in subscribers:
+                        await queue.put((address_field, parsed_nmea))
         except RETRYABLE_ERRORS as e:
             await warn_print_sleep(str(e), config, prefix=f"{host}:{port}")
         except Exception as e:
@@ -207,7 +221,10 @@ async def gen_nmea(host: str, port: int) -> AsyncGenerator[str, None]:
             if not line:
                 log.info(f"Connection closed by {host}:{port}")
                 break
-            yield line.decode().strip()
+            # NMEA is 7-bit ASCII with CRLF terminators: trim at the bytes level
+            # and decode the whole line in one go, rather than running the UTF-8
+            # decoder and a full whitespace strip over every line.
+            yield line.rstrip(b'\r\n').decode('ascii', 'replace')
     finally:
         writer.close()
         try:
@@ -37,19 +37,26 @@ robust service behavior.
 import asyncio
 import json
 import logging
+import time
 from asyncio import Queue
-from collections import defaultdict
 from contextlib import asynccontextmanager
 
 import paho.mqtt.client as mqtt
 
+# orjson is optional. If it is available, use it to encode payloads: it emits
+# bytes directly (which paho accepts) and is several times faster than the
+# standard library encoder.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import parse_nmea
 from service_utils import RETRYABLE_ERRORS, warn_print_sleep
 
 log = logging.getLogger("nmea-logger.mqtt")
 
 # State for MQTT
-last_published = defaultdict(lambda: 0.0)
 publish_intervals = {}
 
 async def mqtt_wait_for_disconnect(disconnect_event: asyncio.Event):
@@ -78,19 +85,55 @@ async def mqtt_publisher_task(mqtt_client: mqtt.Client, queue: Queue, config: di
             MMSI value. The MQTT_OPTIONS section may contain MQTT_TOPIC_PREFIX to
             customize the base topic.
     """
-    global last_published, publish_intervals
+    global publish_intervals
+
+    # Index the rate-limiter state by a small integer id per address field,
+    # rather than hashing the address field into a dict on every message.
+    # Restarting the task (e.g. after an MQTT reconnect) resets the state,
+    # which at worst republishes each address field once early.
+    # Rate limiting runs on the monotonic clock, which is immune to NTP steps
+    # (a wall-clock jump must not suppress or flood publishes). The configured
+    # intervals are in milliseconds; convert once to seconds to match it.
+    type_ids = {af: i for i, af in enumerate(publish_intervals)}
+    intervals = [publish_intervals[af] / 1000.0 for af in type_ids]
+    last_published = [float('-inf')] * len(type_ids)
+
+    # The topic for each address field never changes, so format it once here
+    # rather than once per published message.
+    mqtt_config = config.get("MQTT_OPTIONS", {})
+    topic_prefix = mqtt_config.get("MQTT_TOPIC_PREFIX", "nmea")
+    topics = [f"{topic_prefix}/{config['MMSI']}/{af}" for af in type_ids]
+
+    # Per-message call targets, bound to locals once.
+    get = queue.get
+    get_nowait = queue.get_nowait
+    task_done = queue.task_done
+    get_tid = type_ids.get
+    monotonic = time.monotonic
 
     while True:
-        address_field, parsed_nmea = await queue.get()
-        delta = parsed_nmea["timestamp"] - last_published[address_field]
-        if delta >= publish_intervals[address_field]:
-            mqtt_config = config.get("MQTT_OPTIONS", {})
-            topic = (f"{mqtt_config.get('MQTT_TOPIC_PREFIX', 'nmea')}/"
-                     f"{config['MMSI']}/"
-                     f"{address_field}")
-            mqtt_publish_nmea(mqtt_client, topic, parsed_nmea, config)
-            last_published[address_field] = parsed_nmea["timestamp"]
-        queue.task_done()
+        # Wait for one message, then drain whatever else has already arrived, so
+        # a burst of sentences is published back-to-back in one scheduling slot
+        # instead of one event-loop round trip per message.
+        batch = [await get()]
+        while True:
+            try:
+                batch.append(get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        now = monotonic()
+        for address_field, parsed_nmea in batch:
+            tid = get_tid(address_field)
+            if tid is not None and now - last_published[tid] >= intervals[tid]:
+                # A receiver without a fix yet can flood all-null payloads. Skip
+                # them without charging the rate limiter, so the first real data
+                # goes out immediately.
+                if any(v is not None for k, v in parsed_nmea.items()
+                       if k not in ("sentence_type", "timestamp")):
+                    mqtt_publish_nmea(mqtt_client, topics[tid], parsed_nmea, config)
+                    last_published[tid] = now
+            task_done()
 
 async def mqtt_service(queue: Queue, config: dict):
     """Service that manages the MQTT connection and publisher tasks."""
@@ -160,7 +203,8 @@ def mqtt_on_publish(client, config, mid, reason_code, properties):
 
 def mqtt_publish_nmea(mqtt_client: mqtt.Client, topic: str, parsed_nmea: parse_nmea.NmeaDict, config: dict):
     """Publish parsed NMEA data to MQTT."""
-    info = mqtt_client.publish(topic, json.dumps(parsed_nmea), qos=0)
+    payload = orjson.dumps(parsed_nmea) if orjson is not None else json.dumps(parsed_nmea)
+    info = mqtt_client.publish(topic, payload, qos=0)
     if info.rc != mqtt.MQTT_ERR_SUCCESS:
         log.error(f"Failed to publish to MQTT: {info.rc}")
     if config.get("DEBUG", 0) >= 1 and info.mid % 1000 == 0:
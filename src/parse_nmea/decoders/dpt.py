@@ -2,10 +2,10 @@
 
 For field descriptions: https://gpsd.gitlab.io/gpsd/NMEA.html#_dpt_depth_of_water
 """
-from parse_nmea.__init__ import *
+from parse_nmea import *
 
 
-def decode(parts: list[str]) -> NmeaDict:
+def decode(parts: list[str], parse_float=parse_float) -> NmeaDict:
     data = {
         "depth_below_transducer_meters": parse_float(parts[1]),
         "transducer_depth_meters": parse_float(parts[2]),
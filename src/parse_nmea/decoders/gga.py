@@ -2,10 +2,11 @@
 
 For field descriptions: https://gpsd.gitlab.io/gpsd/NMEA.html#_gga_global_positioning_system_fix_data
 """
-from parse_nmea.__init__ import *
+from parse_nmea import *
 
 
-def decode(parts: list[str]) -> NmeaDict:
+def decode(parts: list[str], parse_time=parse_time, parse_latitude=parse_latitude,
+           parse_longitude=parse_longitude, parse_int=parse_int, parse_float=parse_float) -> NmeaDict:
     data = {
         "timeUTC": parse_time(parts[1]),
         "latitude": parse_latitude(parts[2], parts[3]),
@@ -15,8 +16,9 @@ def decode(parts: list[str]) -> NmeaDict:
         "hdop": parse_float(parts[8]),
         "altitude_meter": parse_float(parts[9]),
     }
-    altitude_unit = parts[10].upper()
-    if altitude_unit != 'M':
+    # Single-letter field: membership test instead of allocating via .upper()
+    altitude_unit = parts[10]
+    if altitude_unit not in ('M', 'm'):
         raise NMEAParsingError(f"Unknown altitude units '{altitude_unit}' (expected 'M')")
 
     return data
@@ -2,14 +2,15 @@
 
 For field descriptions: https://gpsd.gitlab.io/gpsd/NMEA.html#_gll_geographic_position_latitudelongitude
 """
-from parse_nmea.__init__ import *
+from parse_nmea import *
 
 
-def decode(parts: list[str]) -> NmeaDict:
+def decode(parts: list[str], parse_latitude=parse_latitude,
+           parse_longitude=parse_longitude, parse_time=parse_time) -> NmeaDict:
 
     # Check status
-    status = parts[6].upper()
-    if status != "A":
+    status = parts[6]
+    if status not in ('A', 'a'):
         raise NMEAStatusError(f"Bad status ('{status}') for sentence type 'GLL'")
 
     data = {
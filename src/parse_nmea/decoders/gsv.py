@@ -0,0 +1,30 @@
+"""Parse NMEA sentence GSV - Satellites in View
+
+For field descriptions: https://gpsd.gitlab.io/gpsd/NMEA.html#_gsv_satellites_in_view
+"""
+from parse_nmea import *
+
+
+def decode(parts: list[str], parse_int=parse_int) -> NmeaDict:
+    data = {
+        "total_messages": parse_int(parts[1]),
+        "message_number": parse_int(parts[2]),
+        "num_satellites": parse_int(parts[3]),
+    }
+
+    # Each satellite is four fields: PRN, elevation, azimuth, SNR. Slicing out a
+    # whole number of satellites up front avoids a bounds check inside the loop
+    # and drops the NMEA 4.10 trailing signal-id field if present.
+    n = (len(parts) - 4) // 4
+    flat = parts[4:4 + 4 * n]
+    data["satellites"] = [
+        {
+            "prn": parse_int(flat[i]),
+            "elevation": parse_int(flat[i + 1]),
+            "azimuth": parse_int(flat[i + 2]),
+            "snr": parse_int(flat[i + 3]),
+        }
+        for i in range(0, 4 * n, 4)
+    ]
+
+    return data
@@ -2,11 +2,11 @@
 
 For field descriptions: https://gpsd.gitlab.io/gpsd/NMEA.html#_hdt_heading_true
 """
-from parse_nmea.__init__ import *
+from parse_nmea import *
 
 
-def decode(parts: list[str]) -> NmeaDict:
-    if parts[2].upper() != 'T':
+def decode(parts: list[str], parse_float=parse_float) -> NmeaDict:
+    if parts[2] not in ('T', 't'):
         raise NMEAParsingError(f"Unknown HDT reference '{parts[2]}' (expected 'T')")
 
     data = {
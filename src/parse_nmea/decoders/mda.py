@@ -2,10 +2,10 @@
 
 For field descriptions: https://gpsd.gitlab.io/gpsd/NMEA.html#_mda_meteorological_composite
 """
-from parse_nmea.__init__ import *
+from parse_nmea import *
 
 
-def decode(parts: list[str]) -> NmeaDict:
+def decode(parts: list[str], parse_float=parse_float) -> NmeaDict:
     data = {
         "pressure_inches": parse_float(parts[1]),
         "pressure_bars": parse_float(parts[3]),
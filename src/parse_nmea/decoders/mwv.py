@@ -2,41 +2,51 @@
 
 For field descriptions: https://gpsd.gitlab.io/gpsd/NMEA.html#_mwv_wind_speed_and_angle
 """
-from parse_nmea.__init__ import *
-
-
-def decode(parts: list[str]) -> NmeaDict:
+from parse_nmea import *
+
+# Lookup tables for the reference (true vs. apparent wind) and for the
+# conversion of the speed unit to knots. One hash probe each, instead of
+# walking a chain of branches for every sentence.
+_REFERENCES = {
+    'T': ("twa", "tws_knots"),
+    'R': ("awa", "aws_knots"),
+}
+_UNIT_TO_KNOTS = {
+    'N': 1.0,       # already knots
+    'M': 1.94384,   # m/s
+    'K': 0.539957,  # kph
+}
+# Accept lowercase letters too, without paying for .upper() on every sentence.
+_REFERENCES.update({k.lower(): v for k, v in _REFERENCES.items()})
+_UNIT_TO_KNOTS.update({k.lower(): v for k, v in _UNIT_TO_KNOTS.items()})
+
+
+def decode(parts: list[str], parse_float=parse_float) -> NmeaDict:
 
     # Check status
-    status = parts[5].upper()
-    if status != 'A':
+    status = parts[5]
+    if status not in ('A', 'a'):
         raise NMEAStatusError(f"Bad status ('{status}') for sentence type 'MWV'")
 
-    # Determine if we have true or apparent wind
-    reference = parts[2].upper()
-    if reference == 'T':
-        key = "twa"
-        value_key = "tws_knots"
-    elif reference == 'R' or not reference:
-        # Assume apparent (relative) if reference is missing.
-        key = "awa"
-        value_key = "aws_knots"
-    else:
-        raise NMEAParsingError(f"Unknown MWV reference '{reference}' (expected 'T' or 'R')")
+    # Determine if we have true or apparent wind.
+    # Assume apparent (relative) if the reference is missing.
+    reference = parts[2] or 'R'
+    try:
+        key, value_key = _REFERENCES[reference]
+    except KeyError:
+        raise NMEAParsingError(
+            f"Unknown MWV reference '{reference}' (expected 'T' or 'R')") from None
 
     # Convert to knots
+    unit = parts[4]
+    try:
+        factor = _UNIT_TO_KNOTS[unit]
+    except KeyError:
+        raise NMEAParsingError(
+            f"Unknown MWV unit '{unit}' (expected 'M', 'K', or 'N')") from None
     value_knot = parse_float(parts[3])
-    unit = parts[4].upper()
-    if unit == 'N':
-        pass
-    elif unit == 'M':
-        # Unit is m/s
-        value_knot *= 1.94384
-    elif unit == 'K':
-        # Unit is kph
-        value_knot *= 0.539957
-    else:
-        raise NMEAParsingError(f"Unknown MWV unit '{unit}' (expected 'M', 'K', or 'N')")
+    if value_knot is not None and factor != 1.0:
+        value_knot *= factor
 
     data = {
         key: parse_float(parts[1]),
@@ -2,14 +2,15 @@
 
 For field descriptions: https://gpsd.gitlab.io/gpsd/NMEA.html#_rmc_recommended_minimum_navigation_information
 """
-from parse_nmea.__init__ import *
+from parse_nmea import *
 
 
-def decode(parts: list[str]) -> NmeaDict:
+def decode(parts: list[str], parse_datetime=parse_datetime, parse_latitude=parse_latitude,
+           parse_longitude=parse_longitude, parse_float=parse_float) -> NmeaDict:
 
     # Check status
-    status = parts[2].upper()
-    if status != 'A':
+    status = parts[2]
+    if status not in ('A', 'a'):
         raise NMEAStatusError(f"Bad RMC status '{status}' (expected 'A')")
 
     data = {
@@ -22,7 +23,7 @@ def decode(parts: list[str]) -> NmeaDict:
         "magnetic_variation": parts[10],
     }
 
-    if parts[11].upper() == 'W':
+    if parts[11] in ('W', 'w'):
         data["magnetic_variation"] *= -1
 
     return data
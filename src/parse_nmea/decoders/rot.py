@@ -2,11 +2,11 @@
 
 For field descriptions: https://gpsd.gitlab.io/gpsd/NMEA.html#_rot_rate_of_turn
 """
-from parse_nmea.__init__ import *
+from parse_nmea import *
 
 
-def decode(parts: list[str]) -> NmeaDict:
+def decode(parts: list[str], parse_float=parse_float) -> NmeaDict:
     data = {
-        "rate_of_turn": parse_float(parts[1]) if parts[2].upper() == 'A' else None,
+        "rate_of_turn": parse_float(parts[1]) if parts[2] in ('A', 'a') else None,
     }
     return data
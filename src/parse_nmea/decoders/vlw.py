@@ -2,10 +2,10 @@
 
 For field descriptions: https://gpsd.gitlab.io/gpsd/NMEA.html#_vlw_distance_traveled_through_water
 """
-from parse_nmea.__init__ import *
+from parse_nmea import *
 
 
-def decode(parts: list[str]) -> NmeaDict:
+def decode(parts: list[str], parse_float=parse_float) -> NmeaDict:
     data = {
         "water_total_nm": parse_float(parts[1]),
         "water_since_reset_nm": parse_float(parts[3]),
@@ -2,10 +2,10 @@
 
 For field descriptions: https://gpsd.gitlab.io/gpsd/NMEA.html#_vtg_track_made_good_and_ground_speed
 """
-from parse_nmea.__init__ import *
+from parse_nmea import *
 
 
-def decode(parts: list[str]) -> NmeaDict:
+def decode(parts: list[str], parse_float=parse_float) -> NmeaDict:
     data = {
         "cog_true": parse_float(parts[1]),
         "cog_magnetic": parse_float(parts[3]),
@@ -2,17 +2,17 @@
 
 For field descriptions: https://gpsd.gitlab.io/gpsd/NMEA.html#_vwr_relative_wind_speed_and_angle
 """
-from parse_nmea.__init__ import *
+from parse_nmea import *
 
 
-def decode(parts: list[str]) -> NmeaDict:
+def decode(parts: list[str], parse_float=parse_float) -> NmeaDict:
     data = {
         "awa": parse_float(parts[1]),
         "aws_knots": parse_float(parts[3]),
         "aws_mps": parse_float(parts[5]),
         "aws_kph": parse_float(parts[7]),
     }
-    if parts[2].upper() == 'L':
+    if parts[2] in ('L', 'l'):
         data["awa"] *= -1
 
     return data